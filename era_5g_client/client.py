@@ -1,9 +1,14 @@
 import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from threading import Lock
 from typing import Any, Callable, Dict, Optional
 
+import orjson
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter, Retry
 
 from era_5g_client.client_base import NetAppClientBase
 from era_5g_client.dataclasses import MiddlewareInfo
@@ -11,6 +16,23 @@ from era_5g_client.exceptions import FailedToConnect, FailedToDeleteResource, Ne
 from era_5g_client.middleware_resource_checker import MiddlewareResourceChecker
 from era_5g_interface.channels import CallbackInfoClient
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# TCP_NODELAY is urllib3's default, keepalive probes detect a silently dropped connection in about a minute.
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _name, _value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+    # Not all of the options are available on all platforms.
+    if hasattr(socket, _name):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _name), _value))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter with TCP keepalive enabled on the pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class RunTaskMode(Enum):
     """Run task mode."""
@@ -83,6 +105,24 @@ class NetAppClient(NetAppClientBase):
         self.token: Optional[str] = None
         self.args: Optional[Dict[str, Any]] = None
         self._switching: bool = False
+        # Guards the action plan deletion, disconnect() could be called from several threads.
+        self._delete_lock = Lock()
+
+        # Action plan endpoint, built once in run_task() and used for the deletion of the plan.
+        self._action_plan_url = ""
+
+        # Shared HTTP session, keeps the connections to the Middleware alive between the calls.
+        self._session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            # POST (Task/Plan) is not idempotent, a retry could deploy a second plan. Connection errors, which
+            # happen before the request is sent, are retried for all methods.
+            allowed_methods=("GET", "DELETE"),
+            raise_on_status=False,
+        )
+        self._session.mount("http://", _KeepAliveAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
 
     def connect_to_middleware(self, middleware_info: MiddlewareInfo) -> None:
         """Authenticates with the Middleware and obtains a token for future calls.
@@ -95,14 +135,28 @@ class NetAppClient(NetAppClientBase):
         """
 
         self.middleware_info = middleware_info
-        self.middleware_info.address = self.middleware_info.address.rstrip("/")
         try:
             # Connect to the middleware.
             self.token = self.gateway_login(self.middleware_info.user_id, self.middleware_info.password)
+            self._session.headers["Authorization"] = f"Bearer {self.token}"
         except FailedToConnect as ex:
-            self.logger.error(f"Can't connect to Middleware: {ex}")
+            self.logger.error("Can't connect to Middleware: %s", ex)
             raise
 
+    def _require_middleware(self) -> MiddlewareInfo:
+        """Checks that the client is connected to the Middleware.
+
+        Returns:
+            MiddlewareInfo: Info of the connected Middleware.
+
+        Raises:
+            FailedToConnect: Raised when connect_to_middleware was not called.
+        """
+
+        if self.middleware_info is None:
+            raise FailedToConnect("Not connected to Middleware.")
+        return self.middleware_info
+
     def run_task(
         self,
         task_id: str,
@@ -126,19 +180,28 @@ class NetAppClient(NetAppClientBase):
             FailedToConnect: Raised when running the task failed.
         """
 
-        assert self.middleware_info
+        mi = self._require_middleware()
         try:
-            self.action_plan_id = self.gateway_get_plan(
+            action_plan_id = self.gateway_get_plan(
                 task_id, resource_lock, robot_id
             )  # Get the plan_id by sending the token and task_id.
-            if not self.action_plan_id:
+            if not action_plan_id:
                 raise FailedToConnect("Failed to obtain action plan id...")
+        except FailedToConnect as ex:
+            # No plan was created, there is nothing to delete.
+            self.logger.error("Failed to run task: %s", ex)
+            raise
+        self.action_plan_id = action_plan_id
+        orchestrate_plan_url = mi.build_api_endpoint("orchestrate/orchestrate/plan")
+        self._action_plan_url = f"{orchestrate_plan_url}/{self.action_plan_id}"
 
+        try:
             self.resource_checker = MiddlewareResourceChecker(
                 str(self.token),
                 self.action_plan_id,
-                self.middleware_info.build_api_endpoint("orchestrate/orchestrate/plan"),
+                orchestrate_plan_url,
                 self.netapp_address_changed,
+                session=self._session,
                 daemon=True,
             )
 
@@ -151,8 +214,10 @@ class NetAppClient(NetAppClientBase):
                 if mode == RunTaskMode.WAIT_AND_REGISTER:
                     self.register(self.netapp_address, args, wait_until_available=True)
         except (FailedToConnect, NetAppNotReady) as ex:
+            if self.resource_checker is not None:
+                self.resource_checker.stop()
             self.delete_all_resources()
-            self.logger.error(f"Failed to run task: {ex}")
+            self.logger.error("Failed to run task: %s", ex)
             raise
 
     def register(
@@ -187,7 +252,12 @@ class NetAppClient(NetAppClientBase):
         if not self.resource_checker.is_ready():
             raise NetAppNotReady("Not ready.")
         self.args = args
-        super().register(netapp_address, args, wait_until_available, wait_timeout, wait_until_initialized)
+        # A repeated registration replaces only the WebSocket connection, the Middleware resources are kept.
+        switching, self._switching = self._switching, True
+        try:
+            super().register(netapp_address, args, wait_until_available, wait_timeout, wait_until_initialized)
+        finally:
+            self._switching = switching
 
     @property
     def switching(self) -> bool:
@@ -206,11 +276,18 @@ class NetAppClient(NetAppClientBase):
     def disconnect(self) -> None:
         """Disconnects the WebSocket connection, stop resource checker and delete resources."""
 
-        super().disconnect()
-        if not self._switching:
-            if self.resource_checker is not None:
-                self.resource_checker.stop()
-            self.delete_all_resources()
+        if self._switching:
+            super().disconnect()
+            return
+
+        if self.resource_checker is not None:
+            self.resource_checker.stop()
+        # The WebSocket disconnection and the resources deletion are independent, run them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(super().disconnect), executor.submit(self.delete_all_resources)]
+        for future in futures:
+            future.result()
+        self._session.close()
 
     def wait_until_netapp_ready(self) -> None:
         """Blocking wait until the 5G-ERA Network Application is running.
@@ -248,14 +325,16 @@ class NetAppClient(NetAppClientBase):
             FailedToConnect: Raised when could not log in to the Middleware gateway.
         """
 
-        assert self.middleware_info
+        mi = self._require_middleware()
         self.logger.debug("Trying to log into the Middleware")
         # Request Login.
         try:
-            r = requests.post(
-                self.middleware_info.build_api_endpoint("Login"), json={"Id": user_id, "Password": password}
+            r = self._session.post(
+                mi.build_api_endpoint("Login"),
+                data=orjson.dumps({"Id": user_id, "Password": password}),
+                headers=_JSON_HEADERS,
             )
-            response = r.json()
+            response = orjson.loads(r.content)
             if "errors" in response:
                 raise FailedToConnect(str(response["errors"]))
             new_token = response["token"]  # Token is stored here.
@@ -265,14 +344,17 @@ class NetAppClient(NetAppClientBase):
             return new_token
 
         except requests.HTTPError as e:
-            if e.response:
+            # Response evaluates to False for error status codes, it has to be compared with None.
+            if e.response is not None:
                 raise FailedToConnect(
-                    f"Could not login to the Middleware gateway, status code:" f" {e.response.status_code}"
-                )
+                    f"Could not login to the Middleware gateway, status code: {e.response.status_code}"
+                ) from e
             else:
-                raise FailedToConnect(f"Could not login to the Middleware gateway, status code: {e}")
+                raise FailedToConnect(f"Could not login to the Middleware gateway, status code: {e}") from e
         except KeyError as e:
-            raise FailedToConnect(f"Could not login to the Middleware gateway, the response does not contain {e}")
+            raise FailedToConnect(
+                f"Could not login to the Middleware gateway, the response does not contain {e}"
+            ) from e
 
     def gateway_get_plan(self, taskid: str, resource_lock: bool, robot_id: str) -> str:
         """Get task action plan ID from Middleware.
@@ -288,17 +370,16 @@ class NetAppClient(NetAppClientBase):
             FailedToConnect: Raised when could not get the plan.
         """
 
-        assert self.middleware_info
+        mi = self._require_middleware()
         # Request plan.
-        self.logger.debug("Goal task is: " + str(taskid))
-        hed = {"Authorization": f"Bearer {str(self.token)}"}
+        self.logger.debug("Goal task is: %s", taskid)
         data = {
-            "TaskId": str(taskid),
+            "TaskId": taskid,
             "DisableResourceReuse": resource_lock,
             "RobotId": robot_id,
         }
-        r = requests.post(self.middleware_info.build_api_endpoint("Task/Plan"), json=data, headers=hed)
-        response = r.json()
+        r = self._session.post(mi.build_api_endpoint("Task/Plan"), data=orjson.dumps(data), headers=_JSON_HEADERS)
+        response = orjson.loads(r.content)
 
         if not isinstance(response, dict):
             raise FailedToConnect("Invalid response.")
@@ -307,11 +388,11 @@ class NetAppClient(NetAppClientBase):
             raise FailedToConnect(f"response {response['statusCode']}: {response['message']}")
 
         try:
-            action_plan_id = str(response["ActionPlanId"])
-            self.logger.debug("ActionPlanId ** is: " + str(action_plan_id))
+            action_plan_id: str = response["ActionPlanId"]
+            self.logger.debug("ActionPlanId ** is: %s", action_plan_id)
             return action_plan_id
         except KeyError as e:
-            raise FailedToConnect(f"Could not get the plan: {e}")
+            raise FailedToConnect(f"Could not get the plan: {e}") from e
 
     def delete_all_resources(self) -> None:
         """Delete all resources.
@@ -323,30 +404,27 @@ class NetAppClient(NetAppClientBase):
             FailedToDeleteResource: Raised when could not delete the resource.
         """
 
-        if self.token is None or self.action_plan_id is None:
-            return
-
-        try:
-            hed = {"Authorization": "Bearer " + str(self.token)}
-            if self.middleware_info:
-                url = self.middleware_info.build_api_endpoint(
-                    f"orchestrate/orchestrate/plan/{str(self.action_plan_id)}"
-                )
-                response = requests.delete(url, headers=hed)
-
-                if response.ok:
-                    self.logger.debug("Resource deleted")
-                    self.action_plan_id = None
+        with self._delete_lock:
+            if self.token is None or self.action_plan_id is None:
+                return
+
+            try:
+                if self._action_plan_url:
+                    response = self._session.delete(self._action_plan_url)
+
+                    if response.ok:
+                        self.logger.debug("Resource deleted")
+                        self.action_plan_id = None
+                    else:
+                        self.logger.warning("Resource deletion response: %s, %s", response, response.text)
+            except HTTPError as e:
+                if e.response is not None:
+                    self.logger.debug(e.response.status_code)
                 else:
-                    self.logger.warning(f"Resource deletion response: {response}, {response.text}")
-        except HTTPError as e:
-            if e.response:
-                self.logger.debug(e.response.status_code)
-            else:
-                self.logger.debug(e)
-            raise FailedToDeleteResource(
-                f"Error, could not delete the resource, revisit the log files for more details. {e}"
-            )
+                    self.logger.debug(e)
+                raise FailedToDeleteResource(
+                    f"Error, could not delete the resource, revisit the log files for more details. {e}"
+                ) from e
 
     def delete_single_resource(self) -> None:
         """Delete single resource - not implemented."""
@@ -1,13 +1,12 @@
 import logging
 import os
-import statistics
 import time
 from collections.abc import Callable
-from dataclasses import asdict
 from typing import Any, Dict, Optional, Tuple, Union
 
+import numpy as np
+import orjson
 import socketio
-import ujson
 from requests import JSONDecodeError
 from socketio.exceptions import ConnectionError
 
@@ -24,6 +23,36 @@ from era_5g_interface.client_channels import ClientChannels
 from era_5g_interface.dataclasses.control_command import ControlCmdType, ControlCommand
 
 
+class _OrjsonAdapter:
+    """Exposes orjson with the json module interface expected by Socket.IO."""
+
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        # Separators and other json.dumps options are ignored, orjson always produces the compact form.
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s: Union[str, bytes], *args, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+def _control_command_to_dict(control_command: ControlCommand) -> Dict[str, Any]:
+    """Shallow alternative to dataclasses.asdict, the nested data are serialized by the JSON encoder directly.
+
+    Args:
+        control_command (ControlCommand): Control command to be converted.
+
+    Returns:
+        Dict[str, Any]: Control command fields.
+    """
+
+    return {
+        "cmd_type": control_command.cmd_type,
+        "clear_queue": control_command.clear_queue,
+        "data": control_command.data,
+    }
+
+
 class NetAppClientBase:
     """Basic implementation of the 5G-ERA Network Application client.
 
@@ -77,7 +106,7 @@ class NetAppClientBase:
 
         # Create Socket.IO Client.
         self._sio = socketio.Client(
-            logger=socketio_debug, reconnection_attempts=reconnection_attempts, handle_sigint=False, json=ujson
+            logger=socketio_debug, reconnection_attempts=reconnection_attempts, handle_sigint=False, json=_OrjsonAdapter
         )
 
         # Register connect, disconnect a connect error callbacks.
@@ -144,7 +173,8 @@ class NetAppClientBase:
             wait_until_available (bool): If True, the client will repeatedly try to register with the Network Application
                 until it is available. Defaults to False.
             wait_timeout (int): How long the client will try to connect to Network Application. Only used if
-                wait_until_available is True. If negative, the client will wait indefinitely. Defaults to -1.
+                wait_until_available is True. If negative, the client will wait indefinitely. Defaults to -1. Values
+                below 10 seconds also shorten the wait for the namespaces connection.
             wait_until_initialized (bool): If True, the client will repeatedly wait for the Network Application
                 initialization. Defaults to True.
 
@@ -155,10 +185,36 @@ class NetAppClientBase:
             Response: response from the 5G-ERA Network Application.
         """
 
-        # Store args for repeat registration.
-        self._args = args
-        # Connect to server
-        self.netapp_address = netapp_address
+        if self._sio.connected and self.netapp_address == netapp_address and self._args == args:
+            self.logger.debug(f"Already connected to the Network Application: {netapp_address}")
+        else:
+            if self._sio.connected:
+                # The INIT command with the args is sent only when connecting, a new connection is needed.
+                self.logger.info(f"Reconnecting to the Network Application: {netapp_address}")
+                self.disconnect()
+            # Store args for repeat registration.
+            self._args = args
+            # Connect to server
+            self.netapp_address = netapp_address
+            self._connect(netapp_address, wait_until_available, wait_timeout)
+
+        if wait_until_initialized:
+            while not self._initialized:
+                self.logger.warning("Waiting for successful initialization by INIT command. Retrying in 1 second.")
+                time.sleep(1)
+
+    def _connect(self, netapp_address: str, wait_until_available: bool, wait_timeout: int) -> None:
+        """Connects to the 5G-ERA Network Application server DATA_NAMESPACE and CONTROL_NAMESPACE.
+
+        Args:
+            netapp_address (str): The URL of the 5G-ERA Network Application server.
+            wait_until_available (bool): If True, the connection is retried until the Network Application is available.
+            wait_timeout (int): How long the client will try to connect to Network Application.
+
+        Raises:
+            FailedToConnect: Failed to connect to Network Application exception.
+        """
+
         namespaces_to_connect = [DATA_NAMESPACE, CONTROL_NAMESPACE]
         start_time = time.time()
         while True:
@@ -167,7 +223,7 @@ class NetAppClientBase:
                 self._sio.connect(
                     netapp_address,
                     namespaces=namespaces_to_connect,
-                    wait_timeout=10,
+                    wait_timeout=wait_timeout if 0 < wait_timeout < 10 else 10,
                 )
                 break
             except (ConnectionError, JSONDecodeError) as ex:
@@ -179,11 +235,6 @@ class NetAppClientBase:
 
         self.logger.info(f"Client connected to namespaces: {namespaces_to_connect}")
 
-        if wait_until_initialized:
-            while not self._initialized:
-                self.logger.warning("Waiting for successful initialization by INIT command. Retrying in 1 second.")
-                time.sleep(1)
-
     def disconnect(self) -> None:
         """Disconnects the WebSocket connection."""
 
@@ -194,15 +245,15 @@ class NetAppClientBase:
     def print_stats(self):
         """Print stats info - transferred bytes."""
 
-        if self._channels.stats:
-            if len(self._channels.sizes) > 0:
-                self.logger.info(
-                    f"Transferred bytes sum: {sum(self._channels.sizes)} "
-                    f"median: {statistics.median(self._channels.sizes):.3f} "
-                    f"mean: {statistics.mean(self._channels.sizes):.3f} "
-                    f"min: {min(self._channels.sizes)} "
-                    f"max: {max(self._channels.sizes)} "
-                )
+        if self._channels.stats and self._channels.sizes:
+            sizes = np.asarray(self._channels.sizes, dtype=np.int64)
+            self.logger.info(
+                f"Transferred bytes sum: {sizes.sum()} "
+                f"median: {np.median(sizes):.3f} "
+                f"mean: {sizes.mean():.3f} "
+                f"min: {sizes.min()} "
+                f"max: {sizes.max()} "
+            )
 
     def wait(self) -> None:
         """Blocking infinite waiting."""
@@ -317,7 +368,9 @@ class NetAppClientBase:
         """
 
         if self._sio.eio.state == "connected":
-            command_result: Tuple[bool, str] = self._sio.call(COMMAND_EVENT, asdict(control_command), CONTROL_NAMESPACE)
+            command_result: Tuple[bool, str] = self._sio.call(
+                COMMAND_EVENT, _control_command_to_dict(control_command), CONTROL_NAMESPACE
+            )
             return command_result
         else:
             raise ConnectionError("Client is not connected to server.")
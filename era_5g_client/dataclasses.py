@@ -1,17 +1,30 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any, Tuple, Type
 
 
-@dataclass
+@dataclass(frozen=True)
 class MiddlewareInfo:
     """Middleware info class."""
 
-    # The IP or hostname of the middleware.
+    __slots__ = ("address", "user_id", "password")
+
+    # The IP or hostname of the middleware, trailing slashes are stripped.
     address: str
     # The middleware user's ID.
     user_id: str
     # The middleware user's password.
     password: str
 
+    def __post_init__(self) -> None:
+        """Normalizes the address, the endpoint paths are appended after a single slash."""
+
+        object.__setattr__(self, "address", self.address.rstrip("/"))
+
+    def __reduce__(self) -> Tuple[Type["MiddlewareInfo"], Tuple[Any, ...]]:
+        """Recreates the instance through the constructor, the frozen slots can't be restored by copy and pickle."""
+
+        return self.__class__, tuple(getattr(self, f.name) for f in fields(self))
+
     def build_api_endpoint(self, path: str) -> str:
         """Builds an API endpoint on the middleware.
 
@@ -1,8 +1,8 @@
 import logging
-import time
 from threading import Event, Thread
 from typing import Callable, Dict, Optional
 
+import orjson
 import requests
 from requests import HTTPError
 
@@ -10,6 +10,10 @@ from era_5g_client.exceptions import FailedToConnect
 
 logger = logging.getLogger(__name__)
 
+# Resource status polling interval in seconds, the deployment (waiting for the Active status) and the edge switchover
+# (change of the URL) are both detected by the polling.
+POLL_INTERVAL = 0.5
+
 
 class MiddlewareResourceChecker(Thread):
     """Class for checking Middleware resources."""
@@ -20,6 +24,7 @@ class MiddlewareResourceChecker(Thread):
         action_plan_id: str,
         status_endpoint: str,
         url_changed_callback: Optional[Callable] = None,
+        session: Optional[requests.Session] = None,
         **kw,
     ) -> None:
         """Constructor.
@@ -29,23 +34,31 @@ class MiddlewareResourceChecker(Thread):
             action_plan_id (str): Action plan ID.
             status_endpoint (str): Status endpoint.
             url_changed_callback (Callable, optional): Triggered if the received URL has changed.
+            session (requests.Session, optional): HTTP session used for the status queries, so the connection to the
+                Middleware could be reused. A new session is created if not provided.
             **kw: Thread arguments.
         """
 
         super().__init__(**kw)
         self.stop_event = Event()
+        # Set while the resource is ready (or the thread is stopped) to wake up the waiting threads.
+        self._ready_event = Event()
         self.token = token
         self.action_plan_id = action_plan_id
         self.resource_state: Optional[Dict] = None
         self.url_changed_callback = url_changed_callback
         self.status_endpoint = status_endpoint
+        self._status_url = f"{status_endpoint}/{action_plan_id}"
+        self._headers = {"Authorization": f"Bearer {token}"}
         self.status: Optional[str] = None  # TODO define as enum?
         self.url: Optional[str] = None
+        self.session = session if session is not None else requests.Session()
 
     def stop(self) -> None:
-        """Stop thread."""
+        """Stop thread and wake up the threads waiting for the resource."""
 
         self.stop_event.set()
+        self._ready_event.set()
 
     def run(self) -> None:
         """Run thread.
@@ -61,13 +74,18 @@ class MiddlewareResourceChecker(Thread):
                 if services:
                     self.resource_state = services[0]
                     assert isinstance(self.resource_state, dict)
-                    self.status = self.resource_state.get("serviceStatus", None)
                     old_url = self.url
+                    self.status = self.resource_state.get("serviceStatus", None)
                     self.url = self.resource_state.get("serviceUrl", None)
+                    if self.is_ready():
+                        self._ready_event.set()
+                    else:
+                        self._ready_event.clear()
                     if old_url and self.url_changed_callback and old_url != self.url:
                         self.url_changed_callback()
-                    logger.debug(f"{self.status=}, {self.url=}")
-            time.sleep(0.5)  # TODO: adjust or use something similar to rospy.rate.sleep()
+                    logger.debug("self.status=%r, self.url=%r", self.status, self.url)
+            # Waiting on the event lets stop() end the loop without waiting for the whole interval.
+            self.stop_event.wait(POLL_INTERVAL)
 
     def get_resource_status(self) -> Dict:
         """Get resource status.
@@ -76,43 +94,40 @@ class MiddlewareResourceChecker(Thread):
             resource status in dictionary.
         """
 
-        hed = {"Authorization": "Bearer " + str(self.token)}
-        url = f"{self.status_endpoint}/{str(self.action_plan_id)}"
-
         try:  # Query orchestrator for latest information regarding the status of resources.
-            response = requests.get(url, headers=hed)
+            response = self.session.get(self._status_url, headers=self._headers)
         except HTTPError as e:
-            if e.response:
+            if e.response is not None:
                 logger.debug(e.response.status_code)
             else:
                 logger.debug(e)
-            raise FailedToConnect(f"Could not get the resource status, revisit the log files for more details. {e}")
-        resp = response.json()
+            raise FailedToConnect(
+                f"Could not get the resource status, revisit the log files for more details. {e}"
+            ) from e
+        resp = orjson.loads(response.content)
         if isinstance(resp, dict):
             return resp
         else:
             raise FailedToConnect("Invalid response.")
 
-    def wait_until_resource_ready(self, timeout: int = -1) -> None:
-        """Wait until resource is ready.
+    def wait_until_resource_ready(self, timeout: float = -1) -> None:
+        """Wait until resource is ready or the thread is stopped.
 
         Args:
-            timeout (int): Timeout - unused.
-        """
+            timeout (float): Timeout in seconds. If negative, waits indefinitely. Defaults to -1.
 
-        while not self.stop_event.is_set():
-            # if timeout < 0 and time.time() < timeout:
-            #    raise TimeoutError
+        Raises:
+            TimeoutError: Raised when the resource is not ready within the timeout.
+        """
 
-            if self.is_ready():
-                return
-            time.sleep(0.1)
+        if not self._ready_event.wait(timeout if timeout >= 0 else None):
+            raise TimeoutError(f"Resource not ready within {timeout} s.")
 
     def is_ready(self) -> bool:
         """Is resource ready?
 
         Returns:
-            Ready status.
+            Ready status, always False once the checker is stopped.
         """
 
-        return self.status == "Active"
+        return not self.stop_event.is_set() and self.status == "Active"
@@ -1,9 +1,9 @@
 import logging
-import os
 import signal
 import sys
 import time
 import traceback
+from queue import Empty
 from typing import Any, Dict
 
 import cv2
@@ -13,33 +13,33 @@ from era_5g_client.dataclasses import MiddlewareInfo
 from era_5g_client.exceptions import FailedToConnect
 from era_5g_interface.channels import CallbackInfoClient, ChannelType
 
+from common import FrameGrabber, env, required_file
+
 stopped = False
 
+# Signal names for the termination message.
+SIGNAL_NAMES = {int(s): s.name for s in signal.Signals}
+
 # Video from source flag
-FROM_SOURCE = os.getenv("FROM_SOURCE", "").lower() in ("true", "1")
+FROM_SOURCE = env("FROM_SOURCE").lower() in ("true", "1")
 # ip address or hostname of the middleware server
-MIDDLEWARE_ADDRESS = os.getenv("MIDDLEWARE_ADDRESS", "127.0.0.1")
+MIDDLEWARE_ADDRESS = env("MIDDLEWARE_ADDRESS", "127.0.0.1")
 # middleware user
-MIDDLEWARE_USER = os.getenv("MIDDLEWARE_USER", "00000000-0000-0000-0000-000000000000")
+MIDDLEWARE_USER = env("MIDDLEWARE_USER", "00000000-0000-0000-0000-000000000000")
 # middleware password
-MIDDLEWARE_PASSWORD = os.getenv("MIDDLEWARE_PASSWORD", "password")
+MIDDLEWARE_PASSWORD = env("MIDDLEWARE_PASSWORD", "password")
 # middleware 5G-ERA Network Application id (task id)
-MIDDLEWARE_TASK_ID = os.getenv("MIDDLEWARE_TASK_ID", "00000000-0000-0000-0000-000000000000")
+MIDDLEWARE_TASK_ID = env("MIDDLEWARE_TASK_ID", "00000000-0000-0000-0000-000000000000")
 # middleware robot id (robot id)
-MIDDLEWARE_ROBOT_ID = os.getenv("MIDDLEWARE_ROBOT_ID", "00000000-0000-0000-0000-000000000000")
+MIDDLEWARE_ROBOT_ID = env("MIDDLEWARE_ROBOT_ID", "00000000-0000-0000-0000-000000000000")
 
 if not FROM_SOURCE:
     # test video file
-    try:
-        TEST_VIDEO_FILE = os.environ["TEST_VIDEO_FILE"]
-    except KeyError as e:
-        raise Exception(f"Failed to run example, env variable {e} not set.")
-
-    if not os.path.isfile(TEST_VIDEO_FILE):
-        raise Exception("TEST_VIDEO_FILE does not contain valid path to a file.")
+    TEST_VIDEO_FILE = required_file("TEST_VIDEO_FILE")
 
 # Enable logging.
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG, format="%(asctime)s [%(levelname)8s] %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
 
 
 def get_results(results: Dict[str, Any]) -> None:
@@ -49,19 +49,19 @@ def get_results(results: Dict[str, Any]) -> None:
         results (str): The results in json format.
     """
 
-    print(results)
-    pass
+    logger.debug("Results: %s", results)
 
 
 def main() -> None:
     """Creates the client class and starts the data transfer."""
 
     client = None
+    frame_grabber = None
     global stopped
     stopped = False
 
     def signal_handler(sig: int, *_) -> None:
-        logging.info(f"Terminating ({signal.Signals(sig).name})...")
+        logging.info(f"Terminating ({SIGNAL_NAMES.get(sig, sig)})...")
         global stopped
         stopped = True
 
@@ -81,18 +81,29 @@ def main() -> None:
             cap = cv2.VideoCapture(0)
             if not cap.isOpened():
                 raise Exception("Cannot open camera")
+            # Keep only the latest frame, so stale frames do not queue up when sending is slow.
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         else:
             # or from video file
-            cap = cv2.VideoCapture(TEST_VIDEO_FILE)
+            # (hardware accelerated decoding is used if available, software decoding otherwise)
+            cap = cv2.VideoCapture(
+                TEST_VIDEO_FILE, cv2.CAP_FFMPEG, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
             if not cap.isOpened():
                 raise Exception("Cannot open video file")
 
+        # Stale camera frames are dropped, the video file frames are all sent.
+        frame_grabber = FrameGrabber(cap, drop_oldest=FROM_SOURCE, clock=time.perf_counter_ns)
+        frame_grabber.start()
         while not stopped:
-            ret, frame = cap.read()
-            timestamp = time.perf_counter_ns()
-            if not ret:
+            try:
+                # The timeout lets the loop check whether it was stopped.
+                item = frame_grabber.frames.get(timeout=0.5)
+            except Empty:
+                continue
+            if item is None:
                 break
-            resized = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+            resized, timestamp = item
             client.send_image(resized, "image", ChannelType.JPEG, timestamp)
 
     except FailedToConnect as ex:
@@ -103,6 +114,8 @@ def main() -> None:
         traceback.print_exc()
         print(f"Failed to create client instance ({repr(ex)})")
     finally:
+        if frame_grabber is not None:
+            frame_grabber.stop()
         if client is not None:
             client.disconnect()
 
@@ -0,0 +1,116 @@
+import itertools
+import os
+import time
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def env(key: str, default: str = "") -> str:
+    """Reads the environment variable.
+
+    Args:
+        key (str): Name of the environment variable.
+        default (str): Value returned if the variable is not set. Defaults to "".
+
+    Returns:
+        str: Value of the environment variable or the default.
+    """
+
+    return os.environ.get(key, default)
+
+
+def required_file(key: str) -> str:
+    """Reads the environment variable with a path to an existing file.
+
+    Args:
+        key (str): Name of the environment variable.
+
+    Raises:
+        KeyError: Raised when the variable is not set.
+        FileNotFoundError: Raised when the variable does not contain a path to a file.
+
+    Returns:
+        str: Path to the file.
+    """
+
+    path = os.environ.get(key)
+    if path is None:
+        raise KeyError(f"Env variable {key} not set.")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"{key} does not contain valid path to a file.")
+    return path
+
+
+class FrameGrabber(Thread):
+    """Reads and resizes the frames in a separate thread, so the capture is not stalled while sending.
+
+    OpenCV releases the GIL while decoding and resizing, so the capture overlaps with the encoding and sending.
+    """
+
+    def __init__(
+        self,
+        cap: cv2.VideoCapture,
+        size: Tuple[int, int] = (640, 480),
+        drop_oldest: bool = False,
+        queue_size: int = 2,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            cap (cv2.VideoCapture): Opened video capture.
+            size (Tuple[int, int]): Width and height of the resized frames. Defaults to (640, 480).
+            drop_oldest (bool): Drop the oldest queued frame when the queue is full (live sources, e.g. camera),
+                otherwise wait until the frame is taken (video files). Defaults to False.
+            queue_size (int): Maximal number of queued frames. Defaults to 2.
+            clock (Callable[[], int]): Source of the frame timestamps. Defaults to time.time_ns.
+        """
+
+        super().__init__(daemon=True)
+        self._cap = cap
+        self._size = size
+        self._drop_oldest = drop_oldest
+        self._clock = clock
+        self._stop_event = Event()
+        # Resized frames with timestamps, None marks the end of the stream.
+        self.frames: "Queue[Optional[Tuple[np.ndarray, int]]]" = Queue(maxsize=queue_size)
+        # The queued frames, the frame being sent and the frame being captured need a buffer each. Dropped frames
+        # break the order in which the buffers are released, so a new array is allocated for each frame then.
+        self._buffers: List[Optional[np.ndarray]] = (
+            [None] if drop_oldest else [np.empty((size[1], size[0], 3), dtype=np.uint8) for _ in range(queue_size + 2)]
+        )
+
+    def stop(self) -> None:
+        """Stops the reading of the frames."""
+
+        self._stop_event.set()
+
+    def run(self) -> None:
+        try:
+            for buffer in itertools.cycle(self._buffers):
+                ret, frame = self._cap.read()
+                timestamp = self._clock()
+                if self._stop_event.is_set() or not ret:
+                    break
+                # OpenCV allocates a new array instead of using the buffer if the frame format does not match it.
+                resized = cv2.resize(frame, self._size, dst=buffer, interpolation=cv2.INTER_AREA)
+                self._put((resized, timestamp))
+        finally:
+            # The end of the stream is signalled also when reading failed with an exception.
+            self._put(None)
+
+    def _put(self, item: Optional[Tuple[np.ndarray, int]]) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.frames.put(item, block=not self._drop_oldest, timeout=0.1)
+                return
+            except Full:
+                if self._drop_oldest:
+                    try:
+                        self.frames.get_nowait()
+                    except Empty:
+                        pass
@@ -1,6 +1,4 @@
 import logging
-import socket
-from contextlib import closing
 from threading import Event, Thread
 from typing import Any, Dict, Tuple
 
@@ -11,25 +9,21 @@ from flask import Flask
 from era_5g_client.client_base import NetAppClientBase
 from era_5g_interface.channels import COMMAND_EVENT, CONTROL_NAMESPACE, DATA_NAMESPACE, CallbackInfoClient, ChannelType
 from era_5g_interface.exceptions import BackPressureException
-
-
-def find_free_port():
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("", 0))
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
-
+from tests.utils import find_free_port
 
 port = find_free_port()
 
 
 def test_client_send_data() -> None:
     got_data = Event()
+    # Data of the received control commands.
+    commands = []
 
     def json_callback_websocket(sid: str, data: Dict[str, Any]) -> None:
         got_data.set()
 
     def control_callback_websocket(sid: str, data: Dict[str, Any]) -> Tuple[bool, str]:
+        commands.append(data)
         return True, "OK"
 
     def connect_callback_websocket(sid: str, environ: Dict) -> None:
@@ -39,7 +33,9 @@ def test_client_send_data() -> None:
         pass
 
     def thread_flask() -> None:
-        sio = socketio.Server()
+        # Short ping settings, a disconnect over the polling transport can wait for the pending poll request, which
+        # times out after max(ping_interval, ping_timeout) + 5 seconds.
+        sio = socketio.Server(ping_interval=1, ping_timeout=1)
 
         sio.on("json", json_callback_websocket, namespace=DATA_NAMESPACE)
         sio.on(COMMAND_EVENT, control_callback_websocket, namespace=CONTROL_NAMESPACE)
@@ -65,6 +61,14 @@ def test_client_send_data() -> None:
     )
 
     client.register(f"http://localhost:{port}", wait_until_available=True, wait_timeout=5)
+    # Repeated registration with the same Network Application is a no-op.
+    client.register(f"http://localhost:{port}")
+    assert len(commands) == 1
+    # Registration with different args reconnects, so the new args are sent by the INIT command.
+    client.register(f"http://localhost:{port}", args={"test": "test"}, wait_until_available=True, wait_timeout=5)
+    assert client.initialized
+    assert len(commands) == 2
+    assert commands[-1]["data"] == {"test": "test"}
 
     with pytest.raises(BackPressureException):  # noqa:PT012
         for _ in range(100):
@@ -0,0 +1,50 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, dataclass
+
+import pytest
+
+from era_5g_client.dataclasses import MiddlewareInfo
+
+
+@dataclass(frozen=True)
+class ExtendedMiddlewareInfo(MiddlewareInfo):
+    """Subclass with an additional field, copies have to keep the class and the field."""
+
+    port: int = 5000
+
+
+def test_middleware_info() -> None:
+    middleware_info = MiddlewareInfo("localhost:5000//", "user", "password")
+
+    assert middleware_info.address == "localhost:5000"
+    assert middleware_info.build_api_endpoint("Login") == "http://localhost:5000/Login"
+
+    with pytest.raises(FrozenInstanceError):
+        middleware_info.address = "localhost:5001"  # type: ignore[misc]
+
+    assert not hasattr(middleware_info, "__dict__")
+
+
+def test_middleware_info_copy() -> None:
+    middleware_info = MiddlewareInfo("localhost:5000/", "user", "password")
+
+    for copied in (
+        copy.copy(middleware_info),
+        copy.deepcopy(middleware_info),
+        pickle.loads(pickle.dumps(middleware_info)),
+    ):
+        assert copied == middleware_info
+        assert copied.build_api_endpoint("Login") == "http://localhost:5000/Login"
+
+
+def test_middleware_info_subclass_copy() -> None:
+    middleware_info = ExtendedMiddlewareInfo("localhost/", "user", "password", 5001)
+
+    for copied in (
+        copy.copy(middleware_info),
+        copy.deepcopy(middleware_info),
+        pickle.loads(pickle.dumps(middleware_info)),
+    ):
+        assert type(copied) is ExtendedMiddlewareInfo
+        assert copied == middleware_info
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from common import env, required_file
+
+
+def test_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ERA_5G_TEST_ENV", "value")
+
+    assert env("ERA_5G_TEST_ENV") == "value"
+    # The value is not cached, changes of the environment are visible.
+    monkeypatch.setenv("ERA_5G_TEST_ENV", "changed")
+    assert env("ERA_5G_TEST_ENV") == "changed"
+    assert env("ERA_5G_TEST_ENV_UNSET", "default") == "default"
+
+
+def test_required_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    video_file = tmp_path / "video.mp4"
+    video_file.touch()
+    monkeypatch.setenv("ERA_5G_TEST_FILE", str(video_file))
+    monkeypatch.setenv("ERA_5G_TEST_DIR", str(tmp_path))
+
+    assert required_file("ERA_5G_TEST_FILE") == str(video_file)
+    with pytest.raises(FileNotFoundError):
+        required_file("ERA_5G_TEST_DIR")
+    with pytest.raises(KeyError):
+        required_file("ERA_5G_TEST_FILE_UNSET")
+
+    # The existence of the file is checked on every call.
+    video_file.unlink()
+    with pytest.raises(FileNotFoundError):
+        required_file("ERA_5G_TEST_FILE")
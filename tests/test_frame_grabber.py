@@ -0,0 +1,76 @@
+from threading import Event
+from typing import Optional, Tuple
+
+import numpy as np
+import pytest
+
+from common import FrameGrabber
+
+
+class FakeCapture:
+    """Video capture returning the given number of frames, the frame index is stored in the pixels."""
+
+    def __init__(self, frames: int, fail: bool = False) -> None:
+        self.frames = frames
+        self.fail = fail
+        self.index = 0
+        self.done = Event()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.index == self.frames:
+            self.done.set()
+            if self.fail:
+                raise RuntimeError("Capture failed.")
+            return False, None
+        self.index += 1
+        return True, np.full((480, 640, 3), self.index, dtype=np.uint8)
+
+
+def test_frame_grabber_blocks() -> None:
+    frame_grabber = FrameGrabber(FakeCapture(5))  # type: ignore
+    frame_grabber.start()
+
+    received = []
+    item = frame_grabber.frames.get(timeout=5)
+    while item is not None:
+        # The buffer is reused, so the frame has to be processed before taking the next one.
+        received.append(int(item[0][0, 0, 0]))
+        item = frame_grabber.frames.get(timeout=5)
+    assert received == [1, 2, 3, 4, 5]
+
+
+def test_frame_grabber_size() -> None:
+    frame_grabber = FrameGrabber(FakeCapture(1), size=(320, 240))  # type: ignore
+    frame_grabber.start()
+
+    item = frame_grabber.frames.get(timeout=5)
+    assert item is not None
+    assert item[0].shape == (240, 320, 3)
+    assert frame_grabber.frames.get(timeout=5) is None
+
+
+def test_frame_grabber_drops_oldest() -> None:
+    cap = FakeCapture(5)
+    frame_grabber = FrameGrabber(cap, drop_oldest=True)  # type: ignore
+    frame_grabber.start()
+    assert cap.done.wait(5)
+    frame_grabber.join(5)
+    assert not frame_grabber.is_alive()
+
+    # Only the latest frame and the end of the stream fit into the queue.
+    item = frame_grabber.frames.get(timeout=5)
+    assert item is not None
+    assert item[0][0, 0, 0] == 5
+    assert frame_grabber.frames.get(timeout=5) is None
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_frame_grabber_signals_end_on_error() -> None:
+    frame_grabber = FrameGrabber(FakeCapture(1, fail=True))  # type: ignore
+    frame_grabber.start()
+
+    assert frame_grabber.frames.get(timeout=5) is not None
+    assert frame_grabber.frames.get(timeout=5) is None
+    # The exception is reported when the thread finishes, it has to happen within this test.
+    frame_grabber.join(5)
+    assert not frame_grabber.is_alive()
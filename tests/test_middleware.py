@@ -0,0 +1,35 @@
+from threading import Thread
+
+import pytest
+
+from era_5g_client.client import NetAppClient, RunTaskMode
+from era_5g_client.dataclasses import MiddlewareInfo
+from era_5g_client.exceptions import FailedToConnect
+from tests.dummy_middleware import app
+from tests.utils import find_free_port
+
+port = find_free_port()
+
+
+def test_client_run_task() -> None:
+    t = Thread(target=app.run, kwargs={"port": port, "host": "127.0.0.1"})
+    t.daemon = True
+    t.start()
+
+    client = NetAppClient(callbacks_info={})
+    with pytest.raises(FailedToConnect, match="Not connected to Middleware."):
+        client.gateway_get_plan("task", True, "robot")
+
+    # The public gateway calls work with the middleware info only.
+    client.middleware_info = MiddlewareInfo(f"127.0.0.1:{port}/", "user", "password")
+    assert client.gateway_login("user", "password")
+
+    client.connect_to_middleware(MiddlewareInfo(f"127.0.0.1:{port}/", "user", "password"))
+    assert client.token
+
+    client.run_task("task", "robot", True, RunTaskMode.WAIT)
+    assert client.action_plan_id
+    assert client.netapp_address == "http://localhost:5800"
+
+    client.disconnect()
+    assert client.action_plan_id is None
@@ -0,0 +1,46 @@
+import time
+from typing import Dict
+
+import pytest
+
+from era_5g_client.middleware_resource_checker import MiddlewareResourceChecker
+
+
+class FakeResourceChecker(MiddlewareResourceChecker):
+    """Resource checker which becomes Active after the given number of status queries."""
+
+    def __init__(self, active_after: int) -> None:
+        super().__init__("token", "plan", "http://middleware/orchestrate/orchestrate/plan", daemon=True)
+        self.active_after = active_after
+        self.queries = 0
+
+    def get_resource_status(self) -> Dict:
+        self.queries += 1
+        status = "Active" if self.queries > self.active_after else "Pending"
+        return {"actionSequence": [{"Services": [{"serviceStatus": status, "serviceUrl": "http://netapp"}]}]}
+
+
+def test_wait_until_resource_ready() -> None:
+    checker = FakeResourceChecker(active_after=2)
+    checker.start()
+    checker.wait_until_resource_ready(timeout=5)
+    assert checker.is_ready()
+    assert checker.url == "http://netapp"
+    checker.stop()
+    assert not checker.is_ready()
+
+
+def test_wait_until_resource_ready_timeout() -> None:
+    checker = FakeResourceChecker(active_after=1000)
+    checker.start()
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        checker.wait_until_resource_ready(timeout=0.3)
+    assert 0.3 <= time.monotonic() - start_time < 2
+    assert not checker.is_ready()
+
+    # Stopping the checker wakes up the waiting thread.
+    checker.stop()
+    start_time = time.monotonic()
+    checker.wait_until_resource_ready()
+    assert time.monotonic() - start_time < 1
@@ -0,0 +1,16 @@
+import socket
+from contextlib import closing
+
+
+def find_free_port() -> int:
+    """Finds a free TCP port for the test servers.
+
+    Returns:
+        int: Port number.
+    """
+
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(("", 0))
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        port: int = s.getsockname()[1]
+        return port